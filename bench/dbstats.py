@@ -0,0 +1,60 @@
+from typing import Any, Dict
+
+# pg_stat_database 에서 벤치마크 전후로 비교할 누적 카운터들
+COUNTERS = [
+    "xact_commit",
+    "xact_rollback",
+    "blks_read",
+    "blks_hit",
+    "tup_returned",
+    "tup_fetched",
+    "tup_inserted",
+    "tup_updated",
+    "tup_deleted",
+]
+
+
+def snapshot(conn) -> Dict[str, Any]:
+    """현재 DB의 누적 통계와 접속 수를 읽어옵니다."""
+    with conn.cursor() as cur:
+        cur.execute(
+            f"SELECT {', '.join(COUNTERS)} FROM pg_stat_database WHERE datname = current_database()"
+        )
+        row = cur.fetchone()
+        stats = dict(zip(COUNTERS, row))
+    stats["connections"] = connections(conn)
+    return stats
+
+
+def connections(conn) -> int:
+    """현재 DB에 붙어 있는 접속 수 (부하 중 최대 접속 수를 샘플링할 때 씁니다)"""
+    with conn.cursor() as cur:
+        cur.execute("SELECT count(*) FROM pg_stat_activity WHERE datname = current_database()")
+        count = cur.fetchone()[0]
+    conn.commit()
+    return count
+
+
+def diff(before: Dict[str, Any], after: Dict[str, Any], duration_sec: float) -> Dict[str, Any]:
+    """두 스냅샷의 차이를 초당 값과 함께 정리합니다."""
+    out: Dict[str, Any] = {}
+    for name in COUNTERS:
+        delta = after[name] - before[name]
+        out[name] = delta
+        out[f"{name}_per_sec"] = round(delta / duration_sec, 2) if duration_sec else 0
+    hits = out["blks_hit"]
+    reads = out["blks_read"]
+    out["cache_hit_ratio"] = round(hits / (hits + reads), 4) if hits + reads else None
+    out["connections_after"] = after["connections"]
+    return out
+
+
+class ConnectionSampler:
+    """부하가 걸리는 동안 주기적으로 접속 수를 읽어 최대값을 기록합니다."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.peak = 0
+
+    def sample(self):
+        self.peak = max(self.peak, connections(self.conn))
@@ -0,0 +1,189 @@
+import asyncio
+import math
+import os
+import random
+import time
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, List
+
+import httpx
+
+from bench.seed import BENCH_EMAIL_DOMAIN
+
+# 요청 종류별 가중치 (기본 믹스). --mix 옵션으로 덮어쓸 수 있습니다.
+DEFAULT_MIX = {
+    "login": 5,
+    "signup": 1,
+    "dashboard": 50,
+    "history": 20,
+    "job_detail": 14,
+    "create_job": 10,
+}
+
+# 업로드용 가짜 이미지 (JPEG 헤더/트레일러만 맞춘 더미 바이트)
+FAKE_JPEG = b"\xff\xd8\xff\xe0" + os.urandom(64 * 1024) + b"\xff\xd9"
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """nearest-rank 방식의 백분위수"""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+
+    def add(self, op: str, elapsed: float, ok: bool):
+        self.latencies[op].append(elapsed)
+        if not ok:
+            self.errors[op] += 1
+
+    def report(self) -> Dict[str, Any]:
+        duration = (self.finished_at or time.perf_counter()) - self.started_at
+        ops = {}
+        total = 0
+        for op, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            total += len(values)
+            ops[op] = {
+                "count": len(values),
+                "errors": self.errors[op],
+                "rps": round(len(values) / duration, 2) if duration else 0,
+                "p50_ms": round(percentile(values, 50) * 1000, 2),
+                "p90_ms": round(percentile(values, 90) * 1000, 2),
+                "p99_ms": round(percentile(values, 99) * 1000, 2),
+                "max_ms": round(values[-1] * 1000, 2),
+            }
+        return {
+            "duration_sec": round(duration, 2),
+            "requests": total,
+            "rps": round(total / duration, 2) if duration else 0,
+            "errors": sum(self.errors.values()),
+            "ops": ops,
+        }
+
+
+class VirtualUser:
+    """로그인 세션(쿠키)을 하나 가지고 요청 믹스를 반복하는 가상 사용자"""
+
+    def __init__(self, base_url: str, account: Dict[str, str], rng: random.Random):
+        self.account = account
+        self.rng = rng
+        self.client = httpx.AsyncClient(base_url=base_url, timeout=30.0)
+        self.job_ids: List[int] = []
+
+    async def close(self):
+        await self.client.aclose()
+
+    async def login(self) -> httpx.Response:
+        return await self.client.post("/login", json={
+            "email": self.account["email"],
+            "password": self.account["password"],
+        })
+
+    async def signup(self) -> httpx.Response:
+        # 가입은 매번 새 이메일로 하고, 세션은 바꾸지 않습니다.
+        email = f"signup-{uuid.uuid4().hex[:12]}@{BENCH_EMAIL_DOMAIN}"
+        async with httpx.AsyncClient(base_url=self.client.base_url, timeout=30.0) as anon:
+            return await anon.post("/signup", json={
+                "email": email,
+                "password": "bench-password",
+                "nickname": "bench-new",
+            })
+
+    async def dashboard(self) -> httpx.Response:
+        return await self.client.get("/")
+
+    async def history(self) -> httpx.Response:
+        return await self.client.get("/history")
+
+    async def job_detail(self) -> httpx.Response:
+        if not self.job_ids:
+            return await self.dashboard()
+        return await self.client.get(f"/jobs/{self.rng.choice(self.job_ids)}")
+
+    async def create_job(self) -> httpx.Response:
+        res = await self.client.post(
+            "/jobs",
+            files={"face_photo": ("face.jpg", FAKE_JPEG, "image/jpeg")},
+            data={
+                "shot_type": "upper_body",
+                "background": "monotone",
+                "background_color": "#FFFFFF",
+                "lighting": "studio",
+                "expression": "smile",
+                "mood": "professional",
+            },
+        )
+        location = res.headers.get("location", "")
+        if res.status_code == 303 and location.startswith("/jobs/"):
+            self.job_ids.append(int(location.rsplit("/", 1)[1]))
+        return res
+
+
+def is_ok(op: str, res: httpx.Response) -> bool:
+    if op == "create_job":
+        return res.status_code == 303
+    if op == "dashboard":
+        # 세션이 없으면 /login 으로 리다이렉트되므로 실패로 봅니다.
+        return res.status_code == 200
+    return res.status_code < 400
+
+
+async def run_user(vu: VirtualUser, mix: Dict[str, int], deadline: float, recorder: Recorder):
+    ops = list(mix.keys())
+    weights = list(mix.values())
+
+    t0 = time.perf_counter()
+    res = await vu.login()
+    recorder.add("login", time.perf_counter() - t0, is_ok("login", res))
+
+    while time.perf_counter() < deadline:
+        op = vu.rng.choices(ops, weights)[0]
+        t0 = time.perf_counter()
+        try:
+            res = await getattr(vu, op)()
+            ok = is_ok(op, res)
+        except httpx.HTTPError:
+            ok = False
+        recorder.add(op, time.perf_counter() - t0, ok)
+
+
+async def run_load(base_url: str, accounts: List[Dict[str, str]], concurrency: int, duration_sec: float,
+                   mix: Dict[str, int] | None = None, rng_seed: int = 42) -> Dict[str, Any]:
+    """
+    concurrency 명의 가상 사용자가 duration_sec 동안 요청 믹스를 반복합니다.
+    가상 사용자는 시드된 계정을 돌아가며 사용합니다.
+    """
+    mix = mix or DEFAULT_MIX
+    recorder = Recorder()
+    deadline = time.perf_counter() + duration_sec
+    users = [
+        VirtualUser(base_url, accounts[i % len(accounts)], random.Random(rng_seed + i))
+        for i in range(concurrency)
+    ]
+    try:
+        await asyncio.gather(*(run_user(vu, mix, deadline, recorder) for vu in users))
+    finally:
+        recorder.finished_at = time.perf_counter()
+        await asyncio.gather(*(vu.close() for vu in users))
+    return recorder.report()
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """'dashboard=50,history=20' 형식의 문자열을 믹스로 변환합니다."""
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"알 수 없는 요청 종류입니다: {name}")
+        mix[name] = int(weight)
+    return mix
@@ -0,0 +1,62 @@
+-- 벤치마크용 스키마.
+-- 운영 스키마는 Supabase 프로젝트에서 관리되고 저장소에는 DDL 이 없으므로,
+-- 앱(routers/*, worker.py, retention.py)이 실제로 쓰는 테이블/컬럼/enum 만 여기서 다시 만듭니다.
+-- 빈 로컬 Postgres 에 python -m bench 를 돌리면 시드 전에 이 파일을 적용합니다.
+-- 이미 있는 객체는 건드리지 않으므로(IF NOT EXISTS) Supabase 스키마가 있는 DB 에 적용해도 바뀌는 것이 없습니다.
+-- Supabase 의 auth.users 는 로컬에 없으므로 auth_user_id 에 외래키는 걸지 않습니다.
+
+DO $$
+BEGIN
+    CREATE TYPE job_status AS ENUM ('QUEUED', 'PROCESSING', 'COMPLETED');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$
+BEGIN
+    -- prompt 는 worker.save_prompt_detail 이 프롬프트를 저장할 때 씁니다.
+    CREATE TYPE option_type AS ENUM ('shot_type', 'background', 'lighting', 'expression', 'mood', 'prompt');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+CREATE TABLE IF NOT EXISTS public.profiles (
+    auth_user_id uuid PRIMARY KEY,
+    nickname     text NOT NULL,
+    email        text NOT NULL UNIQUE,
+    created_at   timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS public.point_history (
+    id           bigserial PRIMARY KEY,
+    auth_user_id uuid NOT NULL,
+    delta        integer NOT NULL,
+    reason       text,
+    created_at   timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS public.jobs (
+    id           bigserial PRIMARY KEY,
+    auth_user_id uuid NOT NULL,
+    input_urls   jsonb NOT NULL DEFAULT '[]'::jsonb,
+    output_urls  jsonb NOT NULL DEFAULT '[]'::jsonb,
+    status       job_status NOT NULL DEFAULT 'QUEUED',
+    priority     integer NOT NULL DEFAULT 0,
+    locked_by    text,
+    locked_at    timestamptz,
+    error_msg    text,
+    created_at   timestamptz NOT NULL DEFAULT now(),
+    updated_at   timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS public.job_details (
+    id        bigserial PRIMARY KEY,
+    job_id    bigint NOT NULL REFERENCES public.jobs (id) ON DELETE CASCADE,
+    opt_type  option_type NOT NULL,
+    opt_key   text NOT NULL,
+    opt_value text
+);
+
+-- 앱의 조회 패턴(사용자별 목록/합계, 작업별 옵션, 워커의 큐 선점)에 맞춘 인덱스
+CREATE INDEX IF NOT EXISTS jobs_auth_user_id_created_at_idx ON public.jobs (auth_user_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS jobs_queue_idx ON public.jobs (priority, created_at) WHERE status = 'QUEUED';
+CREATE INDEX IF NOT EXISTS job_details_job_id_idx ON public.job_details (job_id);
+CREATE INDEX IF NOT EXISTS point_history_auth_user_id_created_at_idx ON public.point_history (auth_user_id, created_at DESC);
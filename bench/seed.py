@@ -0,0 +1,158 @@
+import json
+import random
+import shutil
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import psycopg2
+
+# 벤치마크용으로 만든 데이터는 이 도메인의 이메일로 구분합니다. (정리할 때 이 값으로 지웁니다)
+# .local 같은 특수 용도 도메인은 EmailStr 검증에서 거부되므로 example.com 하위 도메인을 씁니다.
+BENCH_EMAIL_DOMAIN = "bench.example.com"
+BENCH_PASSWORD = "bench-password"
+# 앱의 routers/jobs.py 가 업로드를 저장하는 위치 (create_job 요청이 uploads/<user_id>/ 에 파일을 씁니다)
+UPLOAD_DIR = Path(__file__).resolve().parent.parent / "uploads"
+SCHEMA_PATH = Path(__file__).resolve().parent / "schema.sql"
+
+# 이력용 작업에는 QUEUED 를 넣지 않습니다. (워커 벤치마크가 처리할 작업은 seed_queued 로만 넣습니다)
+JOB_STATUSES = ["PROCESSING", "COMPLETED", "COMPLETED", "COMPLETED"]
+JOB_OPTIONS = {
+    "shot_type": ["full_body", "upper_body", "face"],
+    "background": ["monotone", "river", "beach", "cafe", "office", "park"],
+    "lighting": ["natural", "studio", "warm_tone", "cool_tone"],
+    "expression": ["smile", "half_smile", "neutral", "laugh", "confident"],
+    "mood": ["casual", "formal", "friendly", "professional", "gentle"],
+}
+
+
+def bench_email(n: int) -> str:
+    return f"user{n}@{BENCH_EMAIL_DOMAIN}"
+
+
+def bench_user_id(email: str) -> str:
+    """
+    이메일로부터 항상 같은 auth_user_id를 만듭니다.
+    스텁 인증 서버(bench/stub_auth.py)도 같은 함수를 쓰기 때문에 시드한 프로필과 로그인 결과가 맞아떨어집니다.
+    """
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"gem-studio-bench:{email.lower()}"))
+
+
+def connect(dsn: str):
+    return psycopg2.connect(dsn)
+
+
+def apply_schema(conn):
+    """bench/schema.sql 을 적용합니다. 이미 있는 테이블/enum 은 그대로 둡니다."""
+    with conn.cursor() as cur:
+        cur.execute(SCHEMA_PATH.read_text())
+    conn.commit()
+
+
+def clear(conn):
+    """이전 실행에서 시드한 벤치마크 데이터와 벤치마크 사용자가 업로드한 파일을 지웁니다."""
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT auth_user_id FROM profiles WHERE email LIKE %s",
+            (f"%@{BENCH_EMAIL_DOMAIN}",)
+        )
+        user_ids = [str(r[0]) for r in cur.fetchall()]
+        if not user_ids:
+            return
+        cur.execute(
+            "DELETE FROM public.job_details WHERE job_id IN (SELECT id FROM public.jobs WHERE auth_user_id::text = ANY(%s))",
+            (user_ids,)
+        )
+        cur.execute("DELETE FROM public.jobs WHERE auth_user_id::text = ANY(%s)", (user_ids,))
+        cur.execute("DELETE FROM public.point_history WHERE auth_user_id::text = ANY(%s)", (user_ids,))
+        cur.execute("DELETE FROM profiles WHERE auth_user_id::text = ANY(%s)", (user_ids,))
+    conn.commit()
+    for user_id in user_ids:
+        shutil.rmtree(UPLOAD_DIR / user_id, ignore_errors=True)
+
+
+def clear_queued(conn):
+    """
+    벤치마크 사용자의 QUEUED 작업을 지웁니다.
+    웹 벤치마크의 POST /jobs 나 시간 초과된 이전 라운드가 남긴 작업 때문에
+    워커 라운드마다 처리할 양이 달라지지 않도록 라운드 시작 전에 부릅니다.
+    """
+    bench_queued = """
+        SELECT j.id FROM public.jobs j
+          JOIN profiles p ON p.auth_user_id = j.auth_user_id
+         WHERE j.status = 'QUEUED'::job_status AND p.email LIKE %s
+    """
+    pattern = (f"%@{BENCH_EMAIL_DOMAIN}",)
+    with conn.cursor() as cur:
+        cur.execute(f"DELETE FROM public.job_details WHERE job_id IN ({bench_queued})", pattern)
+        cur.execute(f"DELETE FROM public.jobs WHERE id IN ({bench_queued})", pattern)
+    conn.commit()
+
+
+def seed(conn, users: int, jobs_per_user: int, history_per_user: int, queued_jobs: int = 0, rng_seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    벤치마크용 사용자/작업/포인트 내역을 넣고, 시드된 사용자 목록을 돌려줍니다.
+    같은 rng_seed로 돌리면 항상 같은 데이터가 만들어져서 실행 간 비교가 가능합니다.
+    queued_jobs 만큼은 워커 벤치마크가 처리할 수 있도록 QUEUED 상태로 추가로 넣습니다.
+    """
+    rng = random.Random(rng_seed)
+    now = datetime.now(timezone.utc)
+    seeded = []
+
+    clear(conn)
+    with conn.cursor() as cur:
+        for n in range(users):
+            email = bench_email(n)
+            user_id = bench_user_id(email)
+            cur.execute(
+                "INSERT INTO profiles (auth_user_id, nickname, email) VALUES (%s, %s, %s)",
+                (user_id, f"bench{n}", email)
+            )
+
+            for i in range(history_per_user):
+                delta = rng.choice([100, 50, -10, -10, -20])
+                cur.execute(
+                    "INSERT INTO public.point_history (auth_user_id, delta, reason, created_at) VALUES (%s, %s, %s, %s)",
+                    (user_id, delta, "충전" if delta > 0 else "프로필 생성", now - timedelta(hours=i))
+                )
+
+            for i in range(jobs_per_user):
+                status = rng.choice(JOB_STATUSES)
+                output_urls = [f"/uploads/{user_id}/out-{i}.png"] if status == "COMPLETED" else []
+                _insert_job(cur, rng, user_id, status, output_urls, now - timedelta(minutes=i))
+
+            seeded.append({"email": email, "password": BENCH_PASSWORD, "user_id": user_id})
+
+    conn.commit()
+    seed_queued(conn, seeded, queued_jobs, rng)
+    return seeded
+
+
+def seed_queued(conn, accounts: List[Dict[str, Any]], count: int, rng: random.Random | None = None):
+    """워커 벤치마크가 처리할 QUEUED 작업을 시드된 사용자들에게 골고루 넣습니다."""
+    rng = rng or random.Random(0)
+    now = datetime.now(timezone.utc)
+    with conn.cursor() as cur:
+        for i in range(count):
+            user_id = accounts[i % len(accounts)]["user_id"]
+            _insert_job(cur, rng, user_id, "QUEUED", [], now)
+    conn.commit()
+
+
+def _insert_job(cur, rng: random.Random, user_id: str, status: str, output_urls: List[str], created_at: datetime):
+    cur.execute(
+        """
+        INSERT INTO public.jobs (auth_user_id, input_urls, output_urls, status, created_at)
+        VALUES (%s, %s, %s, %s::job_status, %s)
+        RETURNING id;
+        """,
+        (user_id, json.dumps([f"/uploads/{user_id}/face.jpg"]), json.dumps(output_urls), status, created_at)
+    )
+    job_id = cur.fetchone()[0]
+    for opt_type, values in JOB_OPTIONS.items():
+        opt_key = "type" if opt_type == "background" else opt_type
+        cur.execute(
+            "INSERT INTO public.job_details (job_id, opt_type, opt_key, opt_value) VALUES (%s, %s, %s, %s)",
+            (job_id, opt_type, opt_key, rng.choice(values))
+        )
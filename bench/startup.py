@@ -0,0 +1,88 @@
+"""
+웹 프로세스 시작(import) 시간 벤치마크.
+
+새 파이썬 프로세스에서 `import main` 에 걸리는 시간을 여러 번 재서 중앙값을 보여주고,
+-X importtime 결과에서 누적 시간이 큰 모듈을 뽑아 어디서 시간이 드는지 보여줍니다.
+
+    python -m bench.startup --runs 10
+    python -m bench.startup --module worker
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+MEASURE_CODE = """
+import time
+t0 = time.perf_counter()
+import {module}
+print(time.perf_counter() - t0)
+"""
+
+
+def measure_once(module: str, env: Dict[str, str]) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", MEASURE_CODE.format(module=module)],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def top_imports(module: str, env: Dict[str, str], limit: int) -> List[Dict[str, Any]]:
+    """
+    -X importtime 의 stderr 출력(self us | cumulative us | 모듈)에서 module 이 직접 불러온 모듈들을 누적 시간순으로 정리합니다.
+    importtime 은 하위 모듈을 부모보다 먼저, 한 단계마다 두 칸씩 들여써서 출력합니다.
+    """
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    subtree = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        if level == 0:
+            if name.strip() == module:
+                break
+            subtree = []
+            continue
+        if level == 1:
+            subtree.append({"module": name.strip(), "cumulative_ms": round(int(cumulative_us) / 1000, 2)})
+    subtree.sort(key=lambda r: r["cumulative_ms"], reverse=True)
+    return subtree[:limit]
+
+
+def run(module: str, runs: int, top: int) -> Dict[str, Any]:
+    env = dict(os.environ)
+    # 바이트코드(.pyc) 생성 비용이 첫 실행에만 섞이지 않도록 한 번 미리 돌려둡니다.
+    measure_once(module, env)
+    samples = [measure_once(module, env) for _ in range(runs)]
+    return {
+        "module": module,
+        "runs": runs,
+        "median_ms": round(statistics.median(samples) * 1000, 2),
+        "min_ms": round(min(samples) * 1000, 2),
+        "max_ms": round(max(samples) * 1000, 2),
+        "top_imports": top_imports(module, env, top),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m bench.startup", description="import 시간 벤치마크")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    print(json.dumps(run(args.module, args.runs, args.top), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+벤치마크용 Supabase Auth(GoTrue) 스텁 서버.
+실제 Supabase를 부르지 않고 signup/login 경로를 부하 테스트할 수 있도록 필요한 엔드포인트만 흉내냅니다.
+
+    uvicorn bench.stub_auth:app --port 9999
+
+앱 쪽에는 SUPABASE_URL=http://127.0.0.1:9999 로 지정하면 됩니다.
+STUB_AUTH_LATENCY_MS 로 외부 서비스 왕복 지연을 흉내낼 수 있습니다.
+
+access token 은 실제 Supabase 처럼 비대칭 키(RS256)로 서명한 JWT 이고,
+/auth/v1/.well-known/jwks.json 으로 공개키를 내려주므로 common/auth_client.py 의 로컬 검증 경로를 그대로 탑니다.
+STUB_AUTH_ALG=HS256 이면 레거시 프로젝트처럼 STUB_AUTH_JWT_SECRET 으로 서명합니다.
+(앱에 SUPABASE_JWT_SECRET 을 주지 않으면 로그인 응답의 user 를 그대로 쓰는 경로를 탑니다)
+"""
+import asyncio
+import json
+import os
+import secrets
+import time
+from datetime import datetime, timezone
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import FastAPI, HTTPException, Request
+
+from bench.seed import BENCH_EMAIL_DOMAIN, BENCH_PASSWORD, bench_user_id
+
+LATENCY_MS = int(os.getenv("STUB_AUTH_LATENCY_MS", "50"))
+TOKEN_TTL_SEC = 3600
+# 토큰의 iss 는 앱이 보는 SUPABASE_URL 기준이어야 하므로 스텁이 뜨는 주소를 알려줘야 합니다.
+STUB_AUTH_URL = os.getenv("STUB_AUTH_URL", "http://127.0.0.1:9999").rstrip("/")
+KID = "bench-stub-key"
+ALG = os.getenv("STUB_AUTH_ALG", "RS256")
+JWT_SECRET = os.getenv("STUB_AUTH_JWT_SECRET", "bench-jwt-secret-for-legacy-hs256-mode")
+
+app = FastAPI()
+
+# email -> password (회원가입으로 만들어진 사용자)
+users: dict[str, str] = {}
+
+signing_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+public_jwk = {
+    **json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(signing_key.public_key())),
+    "kid": KID,
+    "alg": "RS256",
+    "use": "sig",
+}
+
+
+def make_user(email: str, nickname: str | None = None) -> dict:
+    return {
+        "id": bench_user_id(email),
+        "aud": "authenticated",
+        "role": "authenticated",
+        "email": email,
+        "app_metadata": {"provider": "email", "providers": ["email"]},
+        "user_metadata": {"nickname": nickname} if nickname else {},
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def make_session(user: dict) -> dict:
+    now = int(time.time())
+    access_token = jwt.encode(
+        {
+            "iss": f"{STUB_AUTH_URL}/auth/v1",
+            "sub": user["id"],
+            "aud": "authenticated",
+            "role": "authenticated",
+            "email": user["email"],
+            "iat": now,
+            "exp": now + TOKEN_TTL_SEC,
+        },
+        JWT_SECRET if ALG == "HS256" else signing_key,
+        algorithm=ALG,
+        headers=None if ALG == "HS256" else {"kid": KID},
+    )
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "expires_in": TOKEN_TTL_SEC,
+        "expires_at": now + TOKEN_TTL_SEC,
+        "refresh_token": secrets.token_urlsafe(16),
+        "user": user,
+    }
+
+
+def check_password(email: str, password: str) -> bool:
+    if email in users:
+        return users[email] == password
+    # 시드된 사용자는 따로 가입하지 않아도 로그인되도록 합니다.
+    return email.endswith(f"@{BENCH_EMAIL_DOMAIN}") and password == BENCH_PASSWORD
+
+
+@app.post("/auth/v1/signup")
+async def signup(request: Request):
+    body = await request.json()
+    await asyncio.sleep(LATENCY_MS / 1000)
+    email = body["email"].lower()
+    users[email] = body["password"]
+    nickname = body.get("data", {}).get("nickname")
+    # 이메일 인증이 켜진 프로젝트처럼 세션 없이 사용자만 돌려줍니다.
+    return make_user(email, nickname)
+
+
+@app.post("/auth/v1/token")
+async def token(request: Request, grant_type: str):
+    body = await request.json()
+    await asyncio.sleep(LATENCY_MS / 1000)
+    if grant_type != "password":
+        raise HTTPException(status_code=400, detail="unsupported_grant_type")
+    email = body.get("email", "").lower()
+    if not check_password(email, body.get("password", "")):
+        raise HTTPException(status_code=400, detail="Invalid login credentials")
+    return make_session(make_user(email))
+
+
+@app.get("/auth/v1/.well-known/jwks.json")
+async def jwks():
+    return {"keys": [public_jwk]}
+
+
+@app.get("/auth/v1/health")
+async def health():
+    return {"ok": True}
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import multiprocessing as mp
+import os
+import time
+from typing import Any, Dict
+
+from bench.seed import BENCH_EMAIL_DOMAIN, connect
+
+# 스텁 생성기가 한 작업을 처리하는 데 걸리는 시간 (실제 이미지 생성 API 호출을 흉내냅니다)
+STUB_GENERATE_MS = int(os.getenv("STUB_GENERATE_MS", "200"))
+
+
+def _worker_process(dsn: str, worker_id: str, poll_interval: int, processed):
+    """
+    자식 프로세스 진입점. worker.py 는 import 시점에 환경변수를 읽으므로 먼저 설정해둡니다.
+    send_to_nano_banana 만 스텁으로 바꾸고 나머지(작업 선점/락/에러 처리)는 실제 워커 코드를 그대로 씁니다.
+    """
+    os.environ["WORKER_ID"] = worker_id
+    os.environ["POLL_INTERVAL_SEC"] = str(poll_interval)
+    os.environ["PG_CONNINFO"] = dsn
+
+    import worker
+    from psycopg_pool import AsyncConnectionPool
+
+    async def stub_generate(job_id: int, prompt: str, main_image, prop_images):
+        await asyncio.sleep(STUB_GENERATE_MS / 1000)
+        # 다시 선점되지 않도록 완료 처리 (실제 연동부에서 할 후처리를 대신합니다)
+        async with worker.pool.connection() as conn:
+            await conn.execute(
+                "UPDATE public.jobs SET status = 'COMPLETED'::job_status, output_urls = %s, updated_at = now() WHERE id = %s",
+                (json.dumps([f"/uploads/bench/out-{job_id}.png"]), job_id)
+            )
+        with processed.get_lock():
+            processed.value += 1
+
+    async def main():
+        worker.pool = AsyncConnectionPool(conninfo=dsn, open=False)
+        await worker.pool.open()
+        worker.send_to_nano_banana = stub_generate
+        await worker.worker_loop()
+
+    asyncio.run(main())
+
+
+def queued_count(conn) -> int:
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT count(*) FROM public.jobs j
+              JOIN profiles p ON p.auth_user_id = j.auth_user_id
+             WHERE j.status = 'QUEUED'::job_status AND p.email LIKE %s
+            """,
+            (f"%@{BENCH_EMAIL_DOMAIN}",)
+        )
+        count = cur.fetchone()[0]
+    conn.commit()
+    return count
+
+
+def run_workers(dsn: str, workers: int, timeout_sec: float, poll_interval: int = 1) -> Dict[str, Any]:
+    """
+    workers 개의 워커 프로세스를 띄워 시드된 QUEUED 작업이 모두 처리될 때까지의 처리량을 잽니다.
+    """
+    ctx = mp.get_context("spawn")
+    conn = connect(dsn)
+    initial = queued_count(conn)
+    counters = [ctx.Value("i", 0) for _ in range(workers)]
+    procs = [
+        ctx.Process(
+            target=_worker_process,
+            args=(dsn, f"bench-worker-{i}", poll_interval, counters[i]),
+            daemon=True,
+        )
+        for i in range(workers)
+    ]
+
+    started = time.perf_counter()
+    for p in procs:
+        p.start()
+    remaining = initial
+    try:
+        while remaining > 0 and time.perf_counter() - started < timeout_sec:
+            time.sleep(0.5)
+            remaining = queued_count(conn)
+    finally:
+        duration = time.perf_counter() - started
+        for p in procs:
+            p.terminate()
+        for p in procs:
+            p.join(timeout=5)
+        conn.close()
+
+    done = initial - remaining
+    return {
+        "workers": workers,
+        "queued_at_start": initial,
+        "remaining": remaining,
+        "duration_sec": round(duration, 2),
+        "jobs_per_sec": round(done / duration, 2) if duration else 0,
+        "processed_per_worker": [c.value for c in counters],
+        "timed_out": remaining > 0,
+    }
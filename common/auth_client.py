@@ -0,0 +1,195 @@
+import asyncio
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import httpx
+import jwt
+
+import settings
+
+
+class AuthError(Exception):
+    """Supabase Auth 호출 또는 토큰 검증 실패"""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+class InvalidCredentialsError(AuthError):
+    """이메일/비밀번호가 틀렸을 때 (/token 이 400 으로 거절). 그 외 AuthError 는 서버 쪽 문제입니다."""
+
+    def __init__(self, message: str):
+        super().__init__(message, status_code=401)
+
+
+class SupabaseAuth:
+    """
+    Supabase Auth(GoTrue) REST API 를 비동기로 호출하는 어댑터.
+
+    - supabase 클라이언트의 동기 호출 대신 httpx.AsyncClient 를 써서 로그인/가입이 이벤트 루프를 막지 않습니다.
+    - 발급받은 access token 은 Supabase 에 다시 묻지 않고 로컬에서 검증합니다.
+      비대칭 키(RS256/ES256) 프로젝트는 JWKS 를 받아 캐시해두고, 레거시 HS256 프로젝트는 SUPABASE_JWT_SECRET 으로 검증합니다.
+      HS256 프로젝트인데 SUPABASE_JWT_SECRET 이 없으면 로그인 응답(/token)에 함께 온 user 를 그대로 씁니다.
+      토큰을 Supabase 에서 직접 받았으므로 Supabase 를 한 번 더 부르지 않습니다.
+
+    토큰 갱신(refresh)은 다루지 않습니다. 앱 세션은 로그인 때 확인한 user_id/email 만 들고 있고
+    이후에 Supabase 토큰을 쓰지 않으므로 갱신할 일이 없습니다.
+    """
+    JWKS_MIN_REFETCH_SEC = 30
+
+    def __init__(self, url: str, key: str, jwt_secret: Optional[str] = None,
+                 jwks_ttl_sec: int = 600, timeout_sec: float = 10.0):
+        # URL 이 비어 있어도 만들 수는 있게 두고, 실제 호출할 때 실패하도록 합니다. (앱 시작/종료가 설정에 묶이지 않도록)
+        self.url = (url or "").rstrip("/")
+        self.key = key
+        self.jwt_secret = jwt_secret
+        self.jwks_ttl_sec = jwks_ttl_sec
+        self.timeout_sec = timeout_sec
+        self.issuer = f"{self.url}/auth/v1"
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._jwks: Dict[str, jwt.PyJWK] = {}
+        self._jwks_fetched_at = 0.0
+        self._jwks_lock = asyncio.Lock()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # 커넥션을 재사용하도록 클라이언트는 하나만 만들어 둡니다.
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.issuer,
+                headers={"apikey": self.key, "Authorization": f"Bearer {self.key}"},
+                timeout=self.timeout_sec,
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _post(self, path: str, body: Dict[str, Any], params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        try:
+            res = await self.client.post(path, json=body, params=params)
+        except httpx.HTTPError as e:
+            raise AuthError(f"Supabase Auth 호출 실패: {e!r}", status_code=502)
+        return self._parse(res)
+
+    @staticmethod
+    def _parse(res: httpx.Response) -> Dict[str, Any]:
+        try:
+            data = res.json() if res.content else {}
+        except ValueError:
+            data = {}
+        if res.status_code >= 400:
+            message = data.get("msg") or data.get("error_description") or data.get("message") or data.get("detail") or res.text
+            raise AuthError(str(message), status_code=res.status_code)
+        return data
+
+    # ---------- Auth API ----------
+    async def sign_up(self, email: str, password: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """사용자를 만들고 사용자 정보(dict)를 돌려줍니다. 이메일 인증이 꺼진 프로젝트는 세션과 함께 오므로 user 만 꺼냅니다."""
+        res = await self._post("/signup", {"email": email, "password": password, "data": data or {}})
+        user = res.get("user") or res
+        if not user.get("id"):
+            raise AuthError("Supabase Auth에서 사용자 생성에 실패했습니다.", status_code=500)
+        return user
+
+    async def sign_in_with_password(self, email: str, password: str) -> Dict[str, Any]:
+        """
+        로그인하고 세션을 돌려줍니다. 세션의 access token 은 로컬에서 검증하고,
+        검증된 클레임을 session["claims"] 에 넣어줍니다.
+        """
+        try:
+            session = await self._post("/token", {"email": email, "password": password}, params={"grant_type": "password"})
+        except AuthError as e:
+            # GoTrue 는 틀린 이메일/비밀번호를 400(invalid_grant)으로 돌려줍니다. 429 등은 그대로 올려보냄
+            if e.status_code == 400:
+                raise InvalidCredentialsError(e.message)
+            raise
+        access_token = session.get("access_token", "")
+        if self._is_hs256(access_token) and not self.jwt_secret:
+            session["claims"] = self._claims_from_user(session.get("user") or {})
+        else:
+            session["claims"] = await self.verify_token(access_token)
+        return session
+
+    @staticmethod
+    def _claims_from_user(user: Dict[str, Any]) -> Dict[str, Any]:
+        """로컬 검증 결과와 같은 모양의 클레임을 Supabase 가 돌려준 user 로 만듭니다."""
+        if not user.get("id"):
+            raise AuthError("로그인 응답에 사용자 정보가 없습니다.", status_code=502)
+        return {"sub": user["id"], "email": user.get("email"), "aud": user.get("aud"), "role": user.get("role")}
+
+    @staticmethod
+    def _is_hs256(access_token: str) -> bool:
+        try:
+            return jwt.get_unverified_header(access_token).get("alg") == "HS256"
+        except jwt.PyJWTError:
+            return False
+
+    # ---------- Local JWT verification ----------
+    async def verify_token(self, access_token: str) -> Dict[str, Any]:
+        try:
+            header = jwt.get_unverified_header(access_token)
+        except jwt.PyJWTError as e:
+            raise AuthError(f"잘못된 토큰입니다: {e}", status_code=401)
+
+        # 알고리즘은 토큰 헤더가 아니라 검증에 쓸 키 쪽에서 정합니다.
+        if header.get("alg") == "HS256":
+            if not self.jwt_secret:
+                raise AuthError("HS256 토큰을 로컬에서 검증하려면 SUPABASE_JWT_SECRET 이 필요합니다.", status_code=500)
+            key, alg = self.jwt_secret, "HS256"
+        else:
+            signing_key = await self._get_signing_key(header.get("kid"))
+            key, alg = signing_key.key, signing_key.algorithm_name
+
+        try:
+            return jwt.decode(access_token, key, algorithms=[alg], audience="authenticated", issuer=self.issuer)
+        except jwt.PyJWTError as e:
+            raise AuthError(f"토큰 검증 실패: {e}", status_code=401)
+
+    async def _get_signing_key(self, kid: Optional[str]) -> jwt.PyJWK:
+        if kid not in self._jwks or self._jwks_expired():
+            async with self._jwks_lock:
+                # 락을 기다리는 동안 다른 요청이 이미 갱신했을 수 있음.
+                # 모르는 kid 는 키 교체일 수 있으므로 다시 받아보되, 너무 자주 받지는 않도록 합니다.
+                if self._jwks_expired() or (kid not in self._jwks and self._jwks_age() > self.JWKS_MIN_REFETCH_SEC):
+                    await self._fetch_jwks()
+        if kid not in self._jwks:
+            raise AuthError("토큰 서명 키를 찾을 수 없습니다.", status_code=401)
+        return self._jwks[kid]
+
+    def _jwks_age(self) -> float:
+        return time.monotonic() - self._jwks_fetched_at
+
+    def _jwks_expired(self) -> bool:
+        return self._jwks_age() > self.jwks_ttl_sec
+
+    async def _fetch_jwks(self):
+        try:
+            res = await self.client.get("/.well-known/jwks.json")
+            res.raise_for_status()
+        except httpx.HTTPError as e:
+            # 키를 못 받아와도 기존 캐시는 그대로 사용
+            if self._jwks:
+                return
+            raise AuthError(f"JWKS 조회 실패: {e!r}", status_code=502)
+        keys = {}
+        for jwk in res.json().get("keys", []):
+            try:
+                keys[jwk.get("kid")] = jwt.PyJWK(jwk)
+            except jwt.PyJWTError:
+                # 지원하지 않는 키 종류는 건너뜀
+                continue
+        self._jwks = keys
+        self._jwks_fetched_at = time.monotonic()
+
+
+@lru_cache(maxsize=None)
+def get_auth_client() -> SupabaseAuth:
+    """처음 사용할 때 만들고 이후에는 같은 어댑터(JWKS 캐시 포함)를 재사용합니다."""
+    return SupabaseAuth(settings.url, settings.key, jwt_secret=settings.SUPABASE_JWT_SECRET)
@@ -1,4 +1,41 @@
+import os
+import tempfile
+
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 # 'pages' 디렉토리를 템플릿 폴더로 지정합니다.
-templates = Jinja2Templates(directory="pages")
+TEMPLATE_DIR = "pages"
+# 컴파일된 템플릿 바이트코드를 저장해두는 곳 (재시작해도 다시 컴파일하지 않음)
+# import 시점에는 만들지 않고 preload_templates() 에서 만듭니다. 쓸 수 없으면 캐시 없이 동작합니다.
+TEMPLATE_CACHE_DIR = os.getenv("TEMPLATE_CACHE_DIR", ".template_cache")
+# 개발 중에는 1로 두면 html 수정 시 바로 반영됩니다. 운영에서는 매 요청마다 파일 변경 여부를 확인하지 않도록 꺼둡니다.
+TEMPLATE_AUTO_RELOAD = os.getenv("TEMPLATE_AUTO_RELOAD", "0") == "1"
+
+env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=True,
+    auto_reload=TEMPLATE_AUTO_RELOAD,
+)
+templates = Jinja2Templates(env=env)
+
+
+def enable_bytecode_cache() -> bool:
+    """TEMPLATE_CACHE_DIR 에 바이트코드 캐시를 켭니다. 디렉토리를 만들거나 쓸 수 없으면(읽기 전용 파일시스템 등) 캐시 없이 둡니다."""
+    try:
+        os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+        with tempfile.TemporaryFile(dir=TEMPLATE_CACHE_DIR):
+            pass
+    except OSError as e:
+        print(f"템플릿 캐시 디렉토리를 쓸 수 없어 바이트코드 캐시 없이 동작합니다: {e}")
+        return False
+    env.bytecode_cache = FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+    return True
+
+
+def preload_templates():
+    """pages/ 아래 모든 템플릿을 미리 로드해서 첫 요청에서 컴파일 비용이 들지 않도록 합니다."""
+    if env.bytecode_cache is None:
+        enable_bytecode_cache()
+    for name in env.list_templates(extensions=["html"]):
+        env.get_template(name)
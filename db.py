@@ -1,8 +1,11 @@
 import psycopg2
-from settings import DB_USER, DB_PASSWORD, DB_HOST, DB_PORT, DB_DATABASE
+from contextlib import contextmanager
+from settings import DB_USER, DB_PASSWORD, DB_HOST, DB_PORT, DB_DATABASE, check_db_settings
 
-def get_db_conn():
-    """FastAPI 의존성 함수: 각 요청에 대한 psycopg2 DB 연결을 관리합니다."""
+@contextmanager
+def db_conn():
+    """psycopg2 DB 연결을 열고, 블록이 끝나면 커밋(예외 시 롤백) 후 닫습니다."""
+    check_db_settings()
     conn = None
     try:
         conn = psycopg2.connect(
@@ -20,4 +23,9 @@ def get_db_conn():
         raise
     finally:
         if conn:
-            conn.close()
\ No newline at end of file
+            conn.close()
+
+def get_db_conn():
+    """FastAPI 의존성 함수: 각 요청에 대한 psycopg2 DB 연결을 관리합니다."""
+    with db_conn() as conn:
+        yield conn
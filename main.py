@@ -1,11 +1,13 @@
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from routers import auth, dashboard, jobs, history
+from retention import TieredStaticFiles
+from common.templates import preload_templates
+from common.auth_client import get_auth_client
 
 app = FastAPI()
 
-# 정적 파일 마운트 (업로드된 이미지 접근을 위해)
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+# 정적 파일 마운트 (업로드된 이미지 접근을 위해, 아카이브로 옮겨진 파일은 요청 시 되살림)
+app.mount("/uploads", TieredStaticFiles(directory="uploads"), name="uploads")
 
 # 라우터 등록(필수)
 app.include_router(auth.router)
@@ -13,3 +15,13 @@ app.include_router(dashboard.router)
 app.include_router(jobs.router)
 app.include_router(history.router)
 
+
+@app.on_event("startup")
+def on_startup():
+    # 첫 요청 전에 템플릿을 미리 컴파일(또는 바이트코드 캐시에서 로드)해 둡니다.
+    preload_templates()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await get_auth_client().close()
@@ -0,0 +1,410 @@
+"""
+uploads/ 보존 정책(retention) 워커.
+
+uploads/<user_id>/ 아래 파일을 조금씩(틱마다 최대 RETENTION_BATCH_FILES 개) 훑으면서
+- 어떤 작업(jobs.input_urls / output_urls)에도 쓰이지 않는 파일은 고아 파일로 보고 삭제하고,
+  (이름이 사용자 ID(UUID)가 아닌 디렉토리는 작업과 대조할 수 없으므로 건드리지 않습니다)
+- 마지막으로 쓰인 작업도, 마지막으로 내려준 시각도 RETENTION_COLD_DAYS 보다 오래된 파일은 압축해서 아카이브 계층으로 옮깁니다.
+
+어디까지 훑었는지는 아카이브 디렉토리의 상태 파일에 남겨서, 재시작해도 이어서 진행하고
+한 번에 전체 디렉토리를 스캔하지 않습니다. 파일 복사는 RETENTION_MAX_BYTES_PER_SEC 로 속도를 제한합니다.
+아카이브된 파일에 요청이 오면 TieredStaticFiles 가 원래 위치로 되살려서 내려줍니다.
+
+    python retention.py            # 백그라운드로 계속 실행
+    python retention.py --once     # 전체를 한 바퀴만 돌고 종료
+"""
+import argparse
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException
+
+UPLOAD_DIR = "uploads"
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", "archive")
+# local: ARCHIVE_DIR 에 저장, s3: S3 호환 스토리지(MinIO 등)에 저장
+ARCHIVE_BACKEND = os.getenv("ARCHIVE_BACKEND", "local")
+ARCHIVE_S3_BUCKET = os.getenv("ARCHIVE_S3_BUCKET")
+ARCHIVE_S3_ENDPOINT = os.getenv("ARCHIVE_S3_ENDPOINT")
+
+RETENTION_COLD_DAYS = int(os.getenv("RETENTION_COLD_DAYS", "30"))
+# 업로드 직후 jobs 에 INSERT 되기 전의 파일을 고아로 오인해서 지우지 않도록 주는 유예 시간
+ORPHAN_GRACE_SEC = int(os.getenv("ORPHAN_GRACE_SEC", "3600"))
+RETENTION_BATCH_FILES = int(os.getenv("RETENTION_BATCH_FILES", "200"))
+RETENTION_MAX_BYTES_PER_SEC = int(os.getenv("RETENTION_MAX_BYTES_PER_SEC", str(5 * 1024 * 1024)))
+RETENTION_INTERVAL_SEC = int(os.getenv("RETENTION_INTERVAL_SEC", "60"))
+# 파일을 내려줄 때 접근 시각(mtime)을 갱신하는 최소 간격. 매 요청마다 디스크에 쓰지 않도록 하루에 한 번 정도만 갱신
+ACCESS_TOUCH_INTERVAL_SEC = int(os.getenv("ACCESS_TOUCH_INTERVAL_SEC", "86400"))
+
+STATE_FILE = ".retention_state.json"
+CHUNK_SIZE = 64 * 1024
+
+
+# ---------- Archive backends ----------
+class LocalArchive:
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def put(self, key: str, src) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+        os.replace(tmp_path, path)
+
+    def get(self, key: str):
+        """아카이브된 파일 객체를 돌려줍니다. 없으면 None."""
+        try:
+            return open(self._path(key), "rb")
+        except FileNotFoundError:
+            return None
+
+
+class S3Archive:
+    def __init__(self, bucket: str, endpoint_url: Optional[str] = None):
+        try:
+            import boto3
+        except ImportError:
+            raise RuntimeError("ARCHIVE_BACKEND=s3 를 쓰려면 boto3 가 필요합니다.")
+        self.bucket = bucket
+        self.client = boto3.client("s3", endpoint_url=endpoint_url)
+
+    def put(self, key: str, src) -> None:
+        self.client.upload_fileobj(src, self.bucket, key)
+
+    def get(self, key: str):
+        try:
+            return self.client.get_object(Bucket=self.bucket, Key=key)["Body"]
+        except self.client.exceptions.NoSuchKey:
+            return None
+
+
+_archive = None
+
+def get_archive():
+    global _archive
+    if _archive is None:
+        if ARCHIVE_BACKEND == "s3":
+            _archive = S3Archive(ARCHIVE_S3_BUCKET, ARCHIVE_S3_ENDPOINT)
+        else:
+            _archive = LocalArchive(ARCHIVE_DIR)
+    return _archive
+
+
+def archive_key(rel_path: str) -> str:
+    # rel_path: "<user_id>/<파일명>"
+    return f"{rel_path}.gz"
+
+
+def safe_rel_path(rel_path: str) -> Optional[str]:
+    """"<user_id>/<파일명>" 형태만 허용합니다. (경로 조작 방지)"""
+    parts = rel_path.split("/")
+    if len(parts) != 2 or any(p in ("", ".", "..") or "\\" in p for p in parts):
+        return None
+    return rel_path
+
+
+# ---------- Throttled I/O ----------
+class Throttle:
+    """초당 바이트 수를 제한합니다. 서비스 중인 디스크 I/O 를 retention 이 다 잡아먹지 않도록 하기 위함."""
+
+    def __init__(self, bytes_per_sec: int):
+        self.bytes_per_sec = bytes_per_sec
+        self.started = time.monotonic()
+        self.consumed = 0
+
+    def consume(self, n: int):
+        if self.bytes_per_sec <= 0:
+            return
+        self.consumed += n
+        expected = self.consumed / self.bytes_per_sec
+        elapsed = time.monotonic() - self.started
+        if expected > elapsed:
+            time.sleep(expected - elapsed)
+
+
+class ThrottledReader:
+    """읽을 때마다 Throttle 을 거치는 파일 래퍼 (archive.put 에 그대로 넘기기 위함)"""
+
+    def __init__(self, f, throttle: Throttle):
+        self.f = f
+        self.throttle = throttle
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.f.read(CHUNK_SIZE if size is None or size < 0 else min(size, CHUNK_SIZE))
+        self.throttle.consume(len(data))
+        return data
+
+
+def archive_file(local_path: str, rel_path: str, throttle: Throttle) -> int:
+    """파일을 gzip 으로 압축해 아카이브에 올리고 로컬 파일을 지웁니다. 처리한 바이트 수를 돌려줍니다."""
+    tmp_path = f"{local_path}.gz.tmp"
+    try:
+        with open(local_path, "rb") as src, gzip.open(tmp_path, "wb") as dst:
+            while chunk := src.read(CHUNK_SIZE):
+                throttle.consume(len(chunk))
+                dst.write(chunk)
+        with open(tmp_path, "rb") as compressed:
+            get_archive().put(archive_key(rel_path), ThrottledReader(compressed, throttle))
+        size = os.path.getsize(local_path)
+        os.remove(local_path)
+        return size
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def restore_file(rel_path: str) -> bool:
+    """아카이브에서 파일을 원래 위치(uploads/<rel_path>)로 되살립니다."""
+    rel_path = safe_rel_path(rel_path)
+    if rel_path is None:
+        return False
+    local_path = os.path.join(UPLOAD_DIR, rel_path)
+    # 같은 파일에 대한 다른 요청이 먼저 되살렸으면 그대로 사용
+    if os.path.exists(local_path):
+        return True
+    src = get_archive().get(archive_key(rel_path))
+    if src is None:
+        return os.path.exists(local_path)
+    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+    # 동시에 들어온 요청끼리 같은 임시 파일에 쓰지 않도록 요청마다 고유한 임시 파일을 씁니다.
+    # 내용은 같으므로 os.replace 는 누가 마지막에 하든 상관없습니다.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(local_path), suffix=".restore.tmp")
+    try:
+        with gzip.GzipFile(fileobj=src) as gz, os.fdopen(fd, "wb") as dst:
+            shutil.copyfileobj(gz, dst, CHUNK_SIZE)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, local_path)
+    finally:
+        src.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    # 다시 쓰였으므로 바로 다시 아카이브되지 않도록 접근 시각을 갱신
+    touch_access(rel_path, force=True)
+    return True
+
+
+def touch_access(rel_path: str, force: bool = False):
+    """
+    파일의 mtime 을 접근 시각으로 씁니다. (retention 은 mtime 을 마지막 접근 시각으로 봅니다)
+    atime 은 noatime/relatime 마운트에서 믿을 수 없으므로 mtime 을 씁니다.
+    """
+    local_path = os.path.join(UPLOAD_DIR, rel_path)
+    try:
+        if force or os.stat(local_path).st_mtime < time.time() - ACCESS_TOUCH_INTERVAL_SEC:
+            os.utime(local_path)
+    except OSError:
+        pass
+
+
+class TieredStaticFiles(StaticFiles):
+    """
+    /uploads 정적 파일 마운트. 로컬에 없는 파일은 아카이브에서 되살려서 내려줍니다.
+    내려줄 때마다 접근 시각을 남겨서, 계속 보는 파일은 작업이 오래됐어도 아카이브되지 않도록 합니다.
+    """
+
+    async def get_response(self, path: str, scope):
+        rel_path = path.replace(os.sep, "/")
+        try:
+            response = await super().get_response(path, scope)
+        except HTTPException as exc:
+            if exc.status_code != 404 or not await run_in_threadpool(restore_file, rel_path):
+                raise
+            return await super().get_response(path, scope)
+        if safe_rel_path(rel_path) is not None:
+            await run_in_threadpool(touch_access, rel_path)
+        return response
+
+
+# ---------- Incremental scan ----------
+def load_state() -> Dict[str, str]:
+    try:
+        with open(os.path.join(ARCHIVE_DIR, STATE_FILE)) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_state(state: Dict[str, str]):
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    path = os.path.join(ARCHIVE_DIR, STATE_FILE)
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(state, f)
+    os.replace(f"{path}.tmp", path)
+
+
+def next_batch(state: Dict[str, str], limit: int) -> List[str]:
+    """
+    상태 파일에 남은 커서 다음부터 "<user_id>/<파일명>" 을 최대 limit 개 가져옵니다.
+    끝까지 가면 빈 커서로 돌아가 다음 틱에 처음부터 다시 돕니다.
+    """
+    cursor_dir = state.get("dir", "")
+    cursor_file = state.get("file", "")
+    batch: List[str] = []
+    try:
+        user_dirs = sorted(e.name for e in os.scandir(UPLOAD_DIR) if e.is_dir())
+    except FileNotFoundError:
+        return batch
+
+    for user_dir in user_dirs:
+        # 사용자 ID 형태가 아닌 디렉토리는 retention 대상이 아님 (작업과 대조할 수 없으므로 건드리지 않음)
+        if user_dir < cursor_dir or user_id_of(user_dir) is None:
+            continue
+        names = sorted(
+            e.name for e in os.scandir(os.path.join(UPLOAD_DIR, user_dir))
+            if e.is_file() and not e.name.endswith(".tmp")
+        )
+        for name in names:
+            if user_dir == cursor_dir and name <= cursor_file:
+                continue
+            batch.append(f"{user_dir}/{name}")
+            if len(batch) >= limit:
+                state["dir"], state["file"] = user_dir, name
+                return batch
+        if not names:
+            remove_empty_dir(os.path.join(UPLOAD_DIR, user_dir), older_than=time.time() - ORPHAN_GRACE_SEC)
+
+    state["dir"], state["file"] = "", ""
+    return batch
+
+
+def remove_empty_dir(path: str, older_than: float):
+    """
+    빈 디렉토리를 지웁니다. 방금 만들어진 디렉토리는 업로드(routers/jobs.create_job)가
+    makedirs 후 파일을 쓰기 직전일 수 있으므로 older_than 보다 오래된 것만 지웁니다.
+    """
+    try:
+        if os.stat(path).st_mtime < older_than:
+            os.rmdir(path)
+    except OSError:
+        pass
+
+
+def user_id_of(user_dir: str) -> Optional[str]:
+    try:
+        return str(uuid.UUID(user_dir))
+    except ValueError:
+        return None
+
+
+def fetch_last_used(cur, web_paths: List[str], user_id: Optional[str] = None) -> Dict[str, Optional[float]]:
+    """
+    주어진 웹 경로들이 jobs 의 input_urls/output_urls 에 마지막으로 등장한 작업의 변경 시각(epoch)을 돌려줍니다.
+    user_id 를 주면 그 사용자의 작업만 봅니다. (auth_user_id 인덱스를 타는 빠른 경로)
+    user_id 없이 조회한 결과에도 없는 경로만 어떤 작업에서도 쓰이지 않는 고아 파일입니다.
+    """
+    owner_filter = ""
+    params: list = [web_paths]
+    if user_id is not None:
+        # auth_user_id 를 text 로 캐스팅하면 인덱스를 못 타므로 비교 값 쪽을 uuid 로 맞춥니다.
+        owner_filter = "AND j.auth_user_id = %s::uuid"
+        params.append(user_id)
+    cur.execute(
+        f"""
+        SELECT u.url, extract(epoch FROM max(greatest(j.created_at, j.updated_at)))
+          FROM public.jobs j,
+               jsonb_array_elements_text(
+                   coalesce(j.input_urls::jsonb, '[]'::jsonb) || coalesce(j.output_urls::jsonb, '[]'::jsonb)
+               ) AS u(url)
+         WHERE u.url = ANY(%s)
+           {owner_filter}
+         GROUP BY u.url
+        """,
+        params
+    )
+    return {url: float(last_used) if last_used is not None else None for url, last_used in cur.fetchall()}
+
+
+def run_tick(conn, state: Dict[str, str], throttle: Throttle) -> Dict[str, int]:
+    """파일 한 배치를 처리합니다."""
+    result = {"scanned": 0, "archived": 0, "deleted": 0, "bytes": 0}
+    batch = next_batch(state, RETENTION_BATCH_FILES)
+    result["scanned"] = len(batch)
+
+    by_user: Dict[str, List[str]] = {}
+    for rel_path in batch:
+        user_dir, _ = rel_path.split("/", 1)
+        by_user.setdefault(user_dir, []).append(rel_path)
+
+    now = time.time()
+    cold_before = now - RETENTION_COLD_DAYS * 86400
+    for user_dir, rel_paths in by_user.items():
+        user_id = user_id_of(user_dir)
+        if user_id is None:
+            continue
+        stats = {}
+        for rel_path in rel_paths:
+            try:
+                stats[rel_path] = os.stat(os.path.join(UPLOAD_DIR, rel_path))
+            except FileNotFoundError:
+                continue
+
+        with conn.cursor() as cur:
+            last_used = fetch_last_used(cur, [f"/uploads/{p}" for p in stats], user_id)
+            # 주인 작업에 없는 파일도 다른 사용자의 작업이 참조할 수 있으므로, 지우기 전에 전체 작업과 한 번 더 대조합니다.
+            # (유예 시간이 지난 후보만 대상이라 대부분의 틱에서는 이 조회가 없습니다)
+            candidates = [
+                f"/uploads/{p}" for p, st in stats.items()
+                if f"/uploads/{p}" not in last_used and st.st_mtime < now - ORPHAN_GRACE_SEC
+            ]
+            if candidates:
+                last_used.update(fetch_last_used(cur, candidates))
+        conn.commit()
+
+        for rel_path, stat in stats.items():
+            local_path = os.path.join(UPLOAD_DIR, rel_path)
+            web_path = f"/uploads/{rel_path}"
+            if web_path not in last_used:
+                if stat.st_mtime < now - ORPHAN_GRACE_SEC:
+                    os.remove(local_path)
+                    result["deleted"] += 1
+                continue
+            # 작업에서 마지막으로 쓰인 시각과 파일이 마지막으로 접근/복원된 시각(mtime, touch_access 참고) 중 늦은 쪽 기준
+            last_access = max(last_used[web_path] or 0, stat.st_mtime)
+            if last_access < cold_before:
+                result["bytes"] += archive_file(local_path, rel_path, throttle)
+                result["archived"] += 1
+    return result
+
+
+def run(once: bool = False):
+    from db import db_conn
+
+    state = load_state()
+    while True:
+        throttle = Throttle(RETENTION_MAX_BYTES_PER_SEC)
+        try:
+            with db_conn() as conn:
+                while True:
+                    result = run_tick(conn, state, throttle)
+                    save_state(state)
+                    print(f"[retention] {result}")
+                    # 한 바퀴를 다 돌았거나(커서가 처음으로 돌아옴) 백그라운드 모드면 이번 주기는 여기까지
+                    if not once or not state.get("dir"):
+                        break
+        except Exception as e:
+            # DB 오류 등은 다음 주기에 다시 시도
+            print(f"[retention] error: {e!r}")
+            if once:
+                raise
+        if once:
+            return
+        time.sleep(RETENTION_INTERVAL_SEC)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="uploads/ 보존 정책 워커")
+    parser.add_argument("--once", action="store_true", help="전체를 한 바퀴만 돌고 종료")
+    args = parser.parse_args()
+    run(once=args.once)
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, HTTPException, Response, Depends, Cookie
 from fastapi import Request
+from starlette.concurrency import run_in_threadpool
 from models.user import UserCreate, UserLogin
-from settings import supabase
+from common.auth_client import AuthError, InvalidCredentialsError, get_auth_client
 from common.templates import templates
 from session_store import session_store
 from common.security import get_current_user
-from db import get_db_conn
+from db import db_conn
 
 router = APIRouter(tags=["auth"])
 
@@ -15,39 +16,44 @@ def get_signup_page():
     return templates.TemplateResponse("sign_up.html")
 
 
+def _email_registered(email: str) -> bool:
+    with db_conn() as conn, conn.cursor() as cur:
+        # SQL 인젝션 방지를 위해 파라미터 바인딩 사용
+        cur.execute("SELECT email FROM profiles WHERE email = %s", (email,))
+        return cur.fetchone() is not None
+
+
+def _insert_profile(auth_user_id: str, nickname: str, email: str):
+    with db_conn() as conn, conn.cursor() as cur:
+        cur.execute(
+            "INSERT INTO profiles (auth_user_id, nickname, email) VALUES (%s, %s, %s)",
+            (auth_user_id, nickname, email)
+        )
+
+
 @router.post("/signup")
-def sign_up(user: UserCreate, conn = Depends(get_db_conn)):
+async def sign_up(user: UserCreate):
+    """
+    DB 연결은 필요한 구간에서만 잠깐씩 잡고, Supabase 호출을 기다리는 동안에는 연결을 물고 있지 않습니다.
+    (psycopg2 호출은 동기라서 스레드풀에서 실행합니다)
+    """
     try:
-        with conn.cursor() as cur:
-            # 1. 먼저 DB에 해당 이메일로 가입된 프로필이 있는지 확인 (SQL 인젝션 방지)
-            cur.execute("SELECT email FROM profiles WHERE email = %s", (user.email,))
-            if cur.fetchone():
-                raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다.")
+        # 1. 먼저 DB에 해당 이메일로 가입된 프로필이 있는지 확인
+        if await run_in_threadpool(_email_registered, user.email):
+            raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다.")
 
         # 2. Supabase Auth 서비스에 사용자 생성 요청
-        auth_res = supabase.auth.sign_up({
-            "email": user.email,
-            "password": user.password,
-            "options": {"data": {"nickname": user.nickname}}
-        })
-        
-        if not auth_res.user:
-             raise HTTPException(status_code=500, detail="Supabase Auth에서 사용자 생성에 실패했습니다.")
-
-        # 3. FastAPI 앱에서 DB에 직접 프로필 정보 저장 (SQL 인젝션 방지)
-        with conn.cursor() as cur:
-            cur.execute(
-                "INSERT INTO profiles (auth_user_id, nickname, email) VALUES (%s, %s, %s)",
-                (str(auth_res.user.id), user.nickname, user.email)
-            )
-        # get_db_conn 의존성에서 conn.commit()이 호출되어 트랜잭션이 완료됩니다.
+        auth_user = await get_auth_client().sign_up(user.email, user.password, {"nickname": user.nickname})
+
+        # 3. FastAPI 앱에서 DB에 직접 프로필 정보 저장
+        await run_in_threadpool(_insert_profile, str(auth_user["id"]), user.nickname, user.email)
 
         return {"message": f"회원가입 성공! {user.email}로 인증 메일을 확인해주세요."}
 
     except HTTPException as http_exc:
         raise http_exc # 이미 처리된 HTTP 예외는 다시 발생시킴
     except Exception as e:
-        # DB 오류 또는 Supabase 오류가 발생하면 get_db_conn 의존성에서 conn.rollback()이 호출됩니다.
+        # DB 오류가 발생하면 db_conn 에서 conn.rollback()이 호출됩니다.
         raise HTTPException(status_code=500, detail=f"회원가입 처리 중 오류 발생: {str(e)}")
 
 
@@ -56,26 +62,30 @@ def get_login_page(request: Request):
     return templates.TemplateResponse("login.html", {"request": request})
 
 @router.post("/login")
-def login(user: UserLogin, response: Response):
+async def login(user: UserLogin, response: Response):
     try:
-        res = supabase.auth.sign_in_with_password({
-            "email": user.email,
-            "password": user.password
-        })
-
-        if getattr(res, "user", None) and getattr(res, "session", None):
-            session_id = session_store.create({"user_id": str(res.user.id), "email": res.user.email})
-            response.set_cookie(
-                key="session_id",
-                value=session_id,
-                httponly=True,
-                samesite="lax",
-                secure=False
-            )
-            return {"message": "로그인 성공!"}
-        else:
-            raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 잘못되었습니다.")
-
+        # access token 은 어댑터에서 로컬로 검증하고, 검증된 클레임으로 세션을 만듭니다.
+        res = await get_auth_client().sign_in_with_password(user.email, user.password)
+        claims = res["claims"]
+
+        session_id = session_store.create({"user_id": str(claims["sub"]), "email": claims.get("email", user.email)})
+        response.set_cookie(
+            key="session_id",
+            value=session_id,
+            httponly=True,
+            samesite="lax",
+            secure=False
+        )
+        return {"message": "로그인 성공!"}
+
+    except InvalidCredentialsError:
+        raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 잘못되었습니다.")
+    except AuthError as e:
+        # 비밀번호는 맞았는데 토큰 검증이 실패했거나(issuer/서명 키 설정 문제) Supabase 가 요청을 제한한 경우
+        print(f"Error logging in: [{e.status_code}] {e.message}")
+        if e.status_code == 429:
+            raise HTTPException(status_code=503, detail="로그인 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+        raise HTTPException(status_code=500, detail=f"서버 오류: {e.message}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import RedirectResponse
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import HTMLResponse, RedirectResponse
 import uuid
 
-from common.security import try_get_current_user
+from common.security import get_current_user, try_get_current_user
 from common.templates import templates
 from db import get_db_conn
 
@@ -18,6 +18,7 @@ def get_dashboard(request: Request, user: dict | None = Depends(try_get_current_
     coin_balance = 0
     pending_jobs = []
     completed_jobs = []
+    jobs_etag = ""
 
     try:
         with conn.cursor() as cur:
@@ -37,18 +38,8 @@ def get_dashboard(request: Request, user: dict | None = Depends(try_get_current_
                 coin_balance = balance_row[0]
 
             # 작업 목록 조회
-            cur.execute(
-                "SELECT id, status, output_urls FROM public.jobs WHERE auth_user_id = %s ORDER BY created_at DESC",
-                (user_id,)
-            )
-            all_jobs = cur.fetchall()
-
-            for job_row in all_jobs:
-                job = {"id": job_row[0], "status": job_row[1], "output_urls": job_row[2]}
-                if job["status"] in ['QUEUED', 'PROCESSING']:
-                    pending_jobs.append(job)
-                elif job["status"] == 'COMPLETED':
-                    completed_jobs.append(job)
+            jobs_etag = _fetch_jobs_etag(cur, user_id)
+            pending_jobs, completed_jobs = _fetch_jobs(cur, user_id)
 
     except Exception as e:
         print(f"Error fetching dashboard data: {e}")
@@ -61,5 +52,66 @@ def get_dashboard(request: Request, user: dict | None = Depends(try_get_current_
             "coin_balance": coin_balance,
             "pending_jobs": pending_jobs,
             "completed_jobs": completed_jobs,
+            "jobs_etag": jobs_etag,
         },
     )
+
+
+@router.get("/dashboard/jobs", response_class=HTMLResponse)
+def get_dashboard_jobs(request: Request, user: dict = Depends(get_current_user), conn=Depends(get_db_conn)):
+    """
+    대시보드의 작업 목록 부분만 렌더링합니다.
+    If-None-Match 로 받은 ETag 와 같으면 작업 목록을 조회/렌더링하지 않고 304를 돌려줍니다.
+    """
+    user_id = user.get("user_id")
+    with conn.cursor() as cur:
+        jobs_etag = _fetch_jobs_etag(cur, user_id)
+        if request.headers.get("if-none-match") == jobs_etag:
+            return Response(status_code=304, headers={"ETag": jobs_etag})
+        pending_jobs, completed_jobs = _fetch_jobs(cur, user_id)
+
+    return templates.TemplateResponse(
+        "fragments/dashboard_jobs.html",
+        {
+            "request": request,
+            "pending_jobs": pending_jobs,
+            "completed_jobs": completed_jobs,
+        },
+        headers={"ETag": jobs_etag, "X-Has-Pending": "1" if pending_jobs else "0"},
+    )
+
+
+def _fetch_jobs_etag(cur, user_id) -> str:
+    """
+    작업 목록이 바뀌었는지를 전체 목록을 읽지 않고 판단하기 위한 값 (상태별 작업 수 + 마지막 변경 시각)
+    상태를 바꾸면서 updated_at 을 갱신하지 않는 경로가 있어도 목록이 갱신되도록 상태별 개수를 같이 넣습니다.
+    """
+    cur.execute(
+        """
+        SELECT count(*),
+               count(*) FILTER (WHERE status IN ('QUEUED', 'PROCESSING')),
+               count(*) FILTER (WHERE status = 'COMPLETED'),
+               max(greatest(created_at, updated_at))
+          FROM public.jobs
+         WHERE auth_user_id = %s
+        """,
+        (user_id,)
+    )
+    count, pending, completed, last_changed = cur.fetchone()
+    return f'"{count}-{pending}-{completed}-{last_changed.timestamp() if last_changed else 0}"'
+
+
+def _fetch_jobs(cur, user_id):
+    pending_jobs = []
+    completed_jobs = []
+    cur.execute(
+        "SELECT id, status, output_urls FROM public.jobs WHERE auth_user_id = %s ORDER BY created_at DESC",
+        (user_id,)
+    )
+    for job_row in cur.fetchall():
+        job = {"id": job_row[0], "status": job_row[1], "output_urls": job_row[2]}
+        if job["status"] in ['QUEUED', 'PROCESSING']:
+            pending_jobs.append(job)
+        elif job["status"] == 'COMPLETED':
+            completed_jobs.append(job)
+    return pending_jobs, completed_jobs
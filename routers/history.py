@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Request, Query
 from fastapi.responses import HTMLResponse
 import uuid
 
@@ -8,14 +8,19 @@ from db import get_db_conn
 
 router = APIRouter(prefix="/history", tags=["history"])
 
+# 한 번에 렌더링할 포인트 내역 수
+HISTORY_PAGE_SIZE = 50
+
 @router.get("", response_class=HTMLResponse)
 def get_history_page(request: Request, user: dict = Depends(get_current_user), conn=Depends(get_db_conn)):
     """
     포인트 사용 내역 페이지를 렌더링합니다.
+    내역은 첫 HISTORY_PAGE_SIZE 건만 그리고, 나머지는 /history/rows 로 이어서 받습니다.
     """
     user_id = user.get("user_id")
     coin_balance = 0
     history = []
+    next_offset = None
 
     try:
         with conn.cursor() as cur:
@@ -29,13 +34,7 @@ def get_history_page(request: Request, user: dict = Depends(get_current_user), c
                 coin_balance = balance_row[0]
 
             # 포인트 내역 조회
-            cur.execute(
-                "SELECT created_at, reason, delta FROM public.point_history WHERE auth_user_id = %s ORDER BY created_at DESC",
-                (uuid.UUID(user_id),)
-            )
-            history_rows = cur.fetchall()
-            for row in history_rows:
-                history.append({"created_at": row[0], "reason": row[1], "delta": row[2]})
+            history, next_offset = _fetch_history(cur, user_id, 0, HISTORY_PAGE_SIZE)
 
     except Exception as e:
         print(f"Error fetching history data: {e}")
@@ -45,6 +44,40 @@ def get_history_page(request: Request, user: dict = Depends(get_current_user), c
         {
             "request": request,
             "coin_balance": coin_balance,
-            "history": history
+            "history": history,
+            "offset": 0,
+            "next_offset": next_offset
         }
     )
+
+@router.get("/rows", response_class=HTMLResponse)
+def get_history_rows(
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(HISTORY_PAGE_SIZE, ge=1, le=200),
+    user: dict = Depends(get_current_user),
+    conn=Depends(get_db_conn)
+):
+    """
+    포인트 내역 표의 <tr> 행들만 offset 부터 limit 건 렌더링합니다.
+    다음 구간이 남아있으면 X-Next-Offset 헤더로 알려줍니다.
+    """
+    with conn.cursor() as cur:
+        history, next_offset = _fetch_history(cur, user.get("user_id"), offset, limit)
+
+    return templates.TemplateResponse(
+        "fragments/history_rows.html",
+        {"request": request, "history": history, "offset": offset},
+        headers={"X-Next-Offset": str(next_offset) if next_offset else ""}
+    )
+
+def _fetch_history(cur, user_id, offset: int, limit: int):
+    # 다음 구간이 있는지 알기 위해 한 건 더 가져옵니다.
+    cur.execute(
+        "SELECT created_at, reason, delta FROM public.point_history WHERE auth_user_id = %s ORDER BY created_at DESC LIMIT %s OFFSET %s",
+        (uuid.UUID(user_id), limit + 1, offset)
+    )
+    rows = cur.fetchall()
+    history = [{"created_at": row[0], "reason": row[1], "delta": row[2]} for row in rows[:limit]]
+    next_offset = offset + limit if len(rows) > limit else None
+    return history, next_offset
@@ -1,16 +1,16 @@
 import os
-from supabase import create_client, Client
 from dotenv import load_dotenv
 from pathlib import Path
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 load_dotenv()
 
-# Supabase API Client (for Auth)
+# Supabase Auth (common/auth_client.py 에서 처음 사용할 때 클라이언트를 만듭니다)
 url: str = os.environ.get("SUPABASE_URL")
 key: str = os.environ.get("SUPABASE_KEY")
-supabase: Client = create_client(url, key)
+# (선택) 레거시 HS256 서명 프로젝트의 JWT Secret (대시보드 Settings > API > JWT Settings).
+# 설정하면 로그인 토큰을 로컬에서 검증하고, 없으면 로그인 응답에 온 사용자 정보를 그대로 씁니다.
+# 비대칭 키(RS256/ES256) 프로젝트는 필요 없습니다. (JWKS 로 검증)
+SUPABASE_JWT_SECRET = os.environ.get("SUPABASE_JWT_SECRET")
 
 # Direct Database Connection (psycopg2)
 DB_USER = os.environ.get("DB_USER")
@@ -19,9 +19,12 @@ DB_HOST = os.environ.get("DB_HOST")
 DB_PORT = os.environ.get("DB_PORT")
 DB_DATABASE = os.environ.get("DB_DATABASE")
 
-# 모든 변수가 있는지 확인
-if not all([DB_USER, DB_PASSWORD, DB_HOST, DB_PORT, DB_DATABASE]):
-    raise ValueError("데이터베이스 연결을 위한 모든 환경변수(.env)가 설정되지 않았습니다.")
+
+def check_db_settings():
+    # 모든 변수가 있는지 확인 (import 시점이 아니라 실제로 DB에 연결할 때 확인합니다)
+    if not all([DB_USER, DB_PASSWORD, DB_HOST, DB_PORT, DB_DATABASE]):
+        raise ValueError("데이터베이스 연결을 위한 모든 환경변수(.env)가 설정되지 않았습니다.")
+
 
 # File Path Settings
-PAGES_DIR = Path(__file__).resolve().parent / "pages"
\ No newline at end of file
+PAGES_DIR = Path(__file__).resolve().parent / "pages"
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 앱 모듈(settings, common, routers, bench ...)은 저장소 루트 기준으로 import 합니다.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,132 @@
+"""
+common/auth_client.py 를 bench/stub_auth.py 스텁 인증 서버에 붙여서 확인합니다.
+스텁은 네트워크 없이 httpx.ASGITransport 로 같은 프로세스 안에서 호출합니다.
+"""
+import asyncio
+import base64
+import json
+
+import httpx
+import jwt
+import pytest
+from fastapi import HTTPException, Response
+
+from bench import stub_auth
+from bench.seed import BENCH_PASSWORD, bench_email, bench_user_id
+from common.auth_client import AuthError, InvalidCredentialsError, SupabaseAuth
+from models.user import UserLogin
+from routers import auth as auth_router
+
+EMAIL = bench_email(1)
+
+
+@pytest.fixture(params=["RS256", "HS256"])
+def alg(request, monkeypatch):
+    monkeypatch.setattr(stub_auth, "ALG", request.param)
+    monkeypatch.setattr(stub_auth, "LATENCY_MS", 0)
+    monkeypatch.setattr(stub_auth, "users", {})
+    return request.param
+
+
+def make_auth(jwt_secret=None, url=stub_auth.STUB_AUTH_URL, requests=None) -> SupabaseAuth:
+    auth = SupabaseAuth(url, "bench-anon-key", jwt_secret=jwt_secret)
+
+    async def count(request):
+        if requests is not None:
+            requests.append(request.url.path)
+
+    # client 프로퍼티가 만드는 것과 같은 설정으로, 전송만 스텁 앱으로 바꿔 끼웁니다.
+    auth._client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=stub_auth.app),
+        base_url=f"{stub_auth.STUB_AUTH_URL}/auth/v1",
+        headers={"apikey": auth.key, "Authorization": f"Bearer {auth.key}"},
+        event_hooks={"request": [count]},
+    )
+    return auth
+
+
+def run(coro_fn, auth: SupabaseAuth):
+    async def main():
+        try:
+            return await coro_fn(auth)
+        finally:
+            await auth.close()
+    return asyncio.run(main())
+
+
+def tamper(token: str) -> str:
+    header, payload, signature = token.split(".")
+    claims = jwt.decode(token, options={"verify_signature": False})
+    claims["sub"] = "00000000-0000-0000-0000-000000000000"
+    forged = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return f"{header}.{forged}.{signature}"
+
+
+def test_login_verifies_token_locally(alg):
+    secret = stub_auth.JWT_SECRET if alg == "HS256" else None
+    session = run(lambda a: a.sign_in_with_password(EMAIL, BENCH_PASSWORD), make_auth(secret))
+    assert session["claims"]["sub"] == bench_user_id(EMAIL)
+    assert session["claims"]["email"] == EMAIL
+
+
+def test_hs256_without_secret_uses_login_response(monkeypatch):
+    monkeypatch.setattr(stub_auth, "ALG", "HS256")
+    monkeypatch.setattr(stub_auth, "LATENCY_MS", 0)
+    requests = []
+    session = run(lambda a: a.sign_in_with_password(EMAIL, BENCH_PASSWORD), make_auth(requests=requests))
+    assert session["claims"]["sub"] == bench_user_id(EMAIL)
+    # Supabase 는 로그인(/token) 한 번만 부릅니다.
+    assert requests == ["/auth/v1/token"]
+
+
+def test_bad_password(alg):
+    with pytest.raises(InvalidCredentialsError):
+        run(lambda a: a.sign_in_with_password(EMAIL, "wrong-password"), make_auth(stub_auth.JWT_SECRET))
+
+
+def test_tampered_token_is_rejected(alg):
+    async def login_then_verify_forged(auth):
+        session = await auth.sign_in_with_password(EMAIL, BENCH_PASSWORD)
+        return await auth.verify_token(tamper(session["access_token"]))
+
+    with pytest.raises(AuthError) as exc:
+        run(login_then_verify_forged, make_auth(stub_auth.JWT_SECRET))
+    assert exc.value.status_code == 401
+
+
+def test_verification_failure_is_not_bad_credentials(alg):
+    # 비밀번호는 맞았지만 issuer 가 다른 경우 (예: 커스텀 도메인과 SUPABASE_URL 불일치)
+    auth = make_auth(stub_auth.JWT_SECRET, url="https://auth.example.com")
+    with pytest.raises(AuthError) as exc:
+        run(lambda a: a.sign_in_with_password(EMAIL, BENCH_PASSWORD), auth)
+    assert not isinstance(exc.value, InvalidCredentialsError)
+
+
+def test_signup_then_login(alg):
+    email = "new-user@example.com"
+
+    async def signup_then_login(auth):
+        user = await auth.sign_up(email, "new-password", {"nickname": "new"})
+        session = await auth.sign_in_with_password(email, "new-password")
+        return user, session
+
+    user, session = run(signup_then_login, make_auth(stub_auth.JWT_SECRET))
+    assert user["id"] == bench_user_id(email)
+    assert user["user_metadata"] == {"nickname": "new"}
+    assert session["claims"]["sub"] == user["id"]
+
+
+@pytest.mark.parametrize("error, status_code", [
+    (InvalidCredentialsError("Invalid login credentials"), 401),
+    (AuthError("토큰 검증 실패: Invalid issuer", status_code=401), 500),
+    (AuthError("Request rate limit reached", status_code=429), 503),
+])
+def test_login_route_status(monkeypatch, error, status_code):
+    class FailingAuth:
+        async def sign_in_with_password(self, email, password):
+            raise error
+
+    monkeypatch.setattr(auth_router, "get_auth_client", lambda: FailingAuth())
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(auth_router.login(UserLogin(email=EMAIL, password=BENCH_PASSWORD), Response()))
+    assert exc.value.status_code == status_code
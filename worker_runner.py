@@ -0,0 +1,247 @@
+"""
+워커 러너 CLI: 한 호스트에서 워커 프로세스 N개 x 프로세스당 루프 M개를 띄웁니다.
+
+    python worker_runner.py --processes 4 --loops 2 --metrics-port 9100
+
+- 각 루프는 <WORKER_ID 또는 hostname>-p<프로세스번호>-l<루프번호> 형태의 고유 ID로 작업을 선점합니다.
+- GET /metrics 로 큐 깊이와 워커별 saturation, 권장 워커 수를 JSON으로 내보냅니다 (오토스케일링 신호).
+- 죽은 워커 프로세스는 드레인 중이 아니면 다시 띄우고, 죽은 프로세스의 지표는 /metrics 에서 뺍니다.
+- SIGTERM/SIGINT 를 받으면 드레인합니다: 새 작업 선점 중단 -> 처리 중인 작업 마무리 -> 락 해제 후 종료.
+  --drain-timeout 안에 끝나지 않은 프로세스는 강제 종료되며, 그 락은 LOCK_TIMEOUT_SEC 이후 다른 워커가 다시 가져갑니다.
+"""
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing as mp
+import os
+import queue
+import signal
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+import psycopg
+from psycopg_pool import AsyncConnectionPool
+
+import worker
+
+# 워커들의 평균 saturation 을 이 값 근처로 유지하도록 권장 워커 수를 계산합니다.
+TARGET_SATURATION = float(os.getenv("TARGET_SATURATION", "0.7"))
+# 시작하자마자 죽는 프로세스를 계속 다시 띄우지 않도록 같은 번호의 프로세스는 이 간격 이상 두고 재시작합니다.
+RESTART_MIN_INTERVAL_SEC = float(os.getenv("WORKER_RESTART_MIN_INTERVAL_SEC", "5"))
+
+
+def run_process(process_index: int, loops: int, host_id: str, stats_queue):
+    """자식 프로세스 진입점: 한 이벤트 루프 안에서 워커 루프 여러 개를 돌립니다."""
+
+    async def main():
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+
+        # 루프마다 선점용 커넥션 1개 + 여유분
+        worker.pool = AsyncConnectionPool(conninfo=worker.get_conninfo(), min_size=1, max_size=loops + 1, open=False)
+        await worker.pool.open()
+
+        def report(worker_stats):
+            snapshot = worker_stats.snapshot()
+            snapshot["draining"] = snapshot["draining"] or stop.is_set()
+            snapshot["pid"] = os.getpid()
+            try:
+                stats_queue.put_nowait(snapshot)
+            except queue.Full:
+                pass
+
+        worker_ids = [f"{host_id}-p{process_index}-l{i}" for i in range(loops)]
+        try:
+            await asyncio.gather(*(
+                worker.worker_loop(worker_id, stop, worker.WorkerStats(worker_id), report)
+                for worker_id in worker_ids
+            ))
+        finally:
+            await worker.pool.close()
+
+    asyncio.run(main())
+
+
+class Runner:
+    def __init__(self, processes: int, loops: int, host_id: str):
+        self.processes = processes
+        self.loops = loops
+        self.host_id = host_id
+        self.ctx = mp.get_context("spawn")
+        self.stats_queue = self.ctx.Queue(maxsize=10000)
+        self.procs: List[mp.Process] = []
+        self.spawned_at: Dict[int, float] = {}
+        self.workers: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+        self.draining = False
+
+    def start(self):
+        for i in range(self.processes):
+            self.procs.append(self._spawn(i))
+        threading.Thread(target=self._collect_stats, daemon=True).start()
+
+    def _spawn(self, process_index: int) -> mp.Process:
+        p = self.ctx.Process(target=run_process, args=(process_index, self.loops, self.host_id, self.stats_queue))
+        p.start()
+        self.spawned_at[process_index] = time.monotonic()
+        return p
+
+    def restart_dead(self):
+        """드레인 중이 아닐 때 죽은 자식 프로세스를 같은 번호로 다시 띄웁니다. (선점해둔 락은 LOCK_TIMEOUT_SEC 이후 풀림)"""
+        for i, p in enumerate(self.procs):
+            if self.draining or p.is_alive():
+                continue
+            if time.monotonic() - self.spawned_at[i] < RESTART_MIN_INTERVAL_SEC:
+                continue
+            print(f"worker process {i} (pid {p.pid}) exited with {p.exitcode}, restarting")
+            p.join()
+            self.procs[i] = self._spawn(i)
+
+    def _collect_stats(self):
+        while True:
+            snapshot = self.stats_queue.get()
+            with self.lock:
+                self.workers[snapshot["worker_id"]] = snapshot
+
+    def drain(self):
+        """자식 프로세스들에게 SIGTERM 을 보내 드레인을 시작합니다."""
+        self.draining = True
+        for p in self.procs:
+            if p.is_alive():
+                os.kill(p.pid, signal.SIGTERM)
+
+    def wait(self, drain_timeout: float):
+        deadline = None
+        while any(p.is_alive() for p in self.procs) or not self.draining:
+            self.restart_dead()
+            if self.draining and deadline is None:
+                deadline = time.monotonic() + drain_timeout
+            if deadline is not None and time.monotonic() > deadline:
+                for p in self.procs:
+                    if p.is_alive():
+                        p.kill()
+                break
+            time.sleep(0.5)
+        for p in self.procs:
+            p.join()
+
+    def queue_depth(self) -> int | None:
+        try:
+            with psycopg.connect(worker.get_conninfo(), connect_timeout=3) as conn:
+                return conn.execute(worker.QUEUE_DEPTH_SQL, {"lock_timeout": worker.LOCK_TIMEOUT_SEC}).fetchone()[0]
+        except Exception:
+            return None
+
+    def live_workers(self) -> List[Dict[str, Any]]:
+        """살아있는 프로세스의 워커 스냅샷만 돌려주고, 죽은 프로세스의 스냅샷은 지웁니다."""
+        alive_pids = {p.pid for p in self.procs if p.is_alive()}
+        with self.lock:
+            for worker_id in [w for w, snapshot in self.workers.items() if snapshot["pid"] not in alive_pids]:
+                del self.workers[worker_id]
+            return sorted(self.workers.values(), key=lambda w: w["worker_id"])
+
+    def metrics(self) -> Dict[str, Any]:
+        workers = self.live_workers()
+        now = time.time()
+        for w in workers:
+            w["age_sec"] = round(now - w["updated_at"], 1)
+            w["in_flight_sec"] = round(now - w["in_flight_since"], 1) if w.get("in_flight_since") else None
+        alive_processes = sum(p.is_alive() for p in self.procs)
+        total = alive_processes * self.loops
+        queue_depth = self.queue_depth()
+        saturation = sum(effective_saturation(w) for w in workers) / len(workers) if workers else 0.0
+        return {
+            "host": self.host_id,
+            "draining": self.draining,
+            "total_workers": total,
+            "configured_workers": self.processes * self.loops,
+            "alive_processes": alive_processes,
+            "queue_depth": queue_depth,
+            "avg_saturation": round(saturation, 3),
+            "desired_workers": desired_workers(total, saturation, queue_depth),
+            "workers": workers,
+        }
+
+
+def effective_saturation(snapshot: Dict[str, Any]) -> float:
+    """
+    saturation 은 주기가 끝날 때만 갱신되므로, 폴링 간격보다 오래 한 작업을 붙잡고 있는 루프는
+    마지막 값과 관계없이 꽉 찬 것(1.0)으로 봅니다.
+    """
+    in_flight_sec = snapshot.get("in_flight_sec")
+    if in_flight_sec is not None and in_flight_sec >= worker.POLL_INTERVAL_SEC:
+        return 1.0
+    return snapshot["saturation"]
+
+
+def desired_workers(current: int, avg_saturation: float, queue_depth: int | None) -> int:
+    """
+    평균 saturation 이 TARGET_SATURATION 이 되도록 필요한 워커 수를 계산합니다.
+    큐에 워커당 한 배치 이상이 밀려 있고 워커도 바쁘면 최소 1개는 늘리도록 권장합니다.
+    (처리 후에도 QUEUED 로 남는 작업은 큐 길이에 계속 잡히므로, 워커가 쉬고 있을 때는 큐 길이만 보고 늘리지 않음)
+    """
+    if queue_depth is None:
+        return current
+    desired = max(1, math.ceil(current * avg_saturation / TARGET_SATURATION))
+    if queue_depth > current * worker.BATCH_SIZE and avg_saturation >= TARGET_SATURATION:
+        desired = max(desired, current + 1)
+    return desired
+
+
+def serve_metrics(runner: Runner, port: int) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/healthz":
+                body, status = {"ok": not runner.draining}, 200 if not runner.draining else 503
+            elif self.path == "/metrics":
+                body, status = runner.metrics(), 200
+            else:
+                body, status = {"detail": "Not Found"}, 404
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="gem-studio 워커 러너")
+    parser.add_argument("--processes", type=int, default=int(os.getenv("WORKER_PROCESSES", "1")))
+    parser.add_argument("--loops", type=int, default=int(os.getenv("WORKER_LOOPS", "1")), help="프로세스당 워커 루프 수")
+    parser.add_argument("--host-id", default=os.getenv("WORKER_ID", socket.gethostname()))
+    parser.add_argument("--metrics-port", type=int, default=int(os.getenv("WORKER_METRICS_PORT", "9100")))
+    parser.add_argument("--drain-timeout", type=float, default=float(os.getenv("WORKER_DRAIN_TIMEOUT", "120")))
+    args = parser.parse_args()
+
+    runner = Runner(args.processes, args.loops, args.host_id)
+    runner.start()
+    server = serve_metrics(runner, args.metrics_port)
+
+    def on_signal(signum, frame):
+        if not runner.draining:
+            print(f"signal {signum}: 드레인 시작 (최대 {args.drain_timeout}초)")
+            runner.drain()
+
+    signal.signal(signal.SIGTERM, on_signal)
+    signal.signal(signal.SIGINT, on_signal)
+
+    runner.wait(args.drain_timeout)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()